@@ -2,8 +2,10 @@
 """
 Optional normalization helper for surf_report JSON.
 
-This utility is intentionally stdlib-only and can be used by other agents/jobs to
-enforce stable null/field behavior before downstream rendering.
+This utility needs only the standard library (orjson is an optional speedup) and
+can be used by other agents/jobs to enforce stable null/field behavior before
+downstream rendering. It is deliberately standalone, so its JSON helpers are
+copies of the ones in surf_report.py; keep the two in step.
 
 Usage:
   cat raw.json | python scripts/normalize_surf_data.py > normalized.json
@@ -13,7 +15,12 @@ from __future__ import annotations
 
 import json
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, TextIO
+
+try:  # Optional fast path for large payloads.
+    import orjson
+except ImportError:  # pragma: no cover - depends on local environment
+    orjson = None
 
 
 NOW_KEYS = [
@@ -27,6 +34,34 @@ NOW_KEYS = [
     "waterTemperatureC",
 ]
 
+NOW_DEFAULTS: Dict[str, Any] = dict.fromkeys(NOW_KEYS)
+
+
+def json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def write_json(obj: Any, stream: TextIO) -> None:
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json_dumps(obj) + "\n").encode("utf-8")
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(data.decode("utf-8"))
+        return
+    stream.flush()
+    buffer.write(data)
+    buffer.flush()
+
 
 def normalize(payload: Dict[str, Any]) -> Dict[str, Any]:
     payload.setdefault("meta", {})
@@ -35,8 +70,7 @@ def normalize(payload: Dict[str, Any]) -> Dict[str, Any]:
     payload.setdefault("forecast", {})
     payload.setdefault("tides", {})
 
-    for key in NOW_KEYS:
-        payload["now"].setdefault(key, None)
+    payload["now"] = {**NOW_DEFAULTS, **payload["now"]}
 
     payload["meta"].setdefault("warnings", [])
     payload["forecast"].setdefault("windows", {})
@@ -48,12 +82,13 @@ def normalize(payload: Dict[str, Any]) -> Dict[str, Any]:
 
 def main() -> int:
     try:
-        raw = sys.stdin.read()
-        payload = json.loads(raw)
+        # Read raw bytes; both orjson and json parse UTF-8 input without a str decode pass.
+        raw = getattr(sys.stdin, "buffer", sys.stdin).read()
+        payload = json_loads(raw)
         if not isinstance(payload, dict):
             print("Expected top-level JSON object", file=sys.stderr)
             return 2
-        print(json.dumps(normalize(payload), ensure_ascii=True, sort_keys=True))
+        write_json(normalize(payload), sys.stdout)
         return 0
     except json.JSONDecodeError as exc:
         print(f"Invalid JSON: {exc}", file=sys.stderr)
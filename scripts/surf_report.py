@@ -10,6 +10,7 @@ Purpose:
 Usage examples:
   python scripts/surf_report.py --location "Highcliffe Beach" --horizon 72h --output json
   python scripts/surf_report.py --lat 50.735 --lon -1.705 --horizon 24h --output json
+  python scripts/surf_report.py --coords 50.735 -1.705 --horizon 24h --output json
   python scripts/surf_report.py --location "Highcliffe Beach" --horizon now --mock --output pretty
   python scripts/surf_report.py --location "Highcliffe Beach" --at "2026-02-23T06:00:00Z" --output json
 
@@ -17,6 +18,9 @@ Environment:
   STORMGLASS_API_KEY         Required unless --mock.
   GOOGLE_GEOCODING_API_KEY   Required when --location unless --mock.
 
+Geocoding results are cached in ~/.cache/stormglass-skill/geocode.sqlite3
+(default TTL 30 days); disable with --no-geocode-cache.
+
 Exit codes:
   0 success
   2 invalid CLI usage
@@ -28,15 +32,30 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import bisect
+import gzip
+import heapq
 import json
 import math
 import os
+import re
+import sqlite3
 import sys
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
+import zlib
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+try:  # Optional fast path; the CLI stays stdlib-only without it.
+    import orjson
+except ImportError:  # pragma: no cover - depends on local environment
+    orjson = None
+
 
 WEATHER_ENDPOINT = "https://api.stormglass.io/v2/weather/point"
 TIDE_ENDPOINTS = [
@@ -61,6 +80,17 @@ METRIC_MAP = {
 
 HORIZON_HOURS = {"now": 1, "24h": 24, "48h": 48, "72h": 72}
 
+# Constant query fragments, encoded once at import time.
+WEATHER_PARAMS = ",".join(METRIC_MAP)
+OSM_BASE_QUERY = urllib.parse.urlencode({"format": "jsonv2", "limit": "5", "addressdetails": "0"})
+
+GEOCODE_CACHE_PATH = os.path.expanduser("~/.cache/stormglass-skill/geocode.sqlite3")
+GEOCODE_CACHE_TTL_DAYS = 30
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_TOTAL = 2
+RETRY_BACKOFF_S = 0.3
+
 
 class ApiError(RuntimeError):
     """Raised for external API errors."""
@@ -75,7 +105,9 @@ def now_utc() -> datetime:
 
 
 def iso_z(dt: datetime) -> str:
-    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    if dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    return dt.isoformat().replace("+00:00", "Z")
 
 
 def parse_time(value: str) -> datetime:
@@ -88,22 +120,71 @@ def parse_time(value: str) -> datetime:
 
 
 def to_unix_seconds(dt: datetime) -> int:
-    return int(dt.astimezone(timezone.utc).timestamp())
+    if dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    return int(dt.timestamp())
+
+
+def json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    # Same layout as orjson (compact, raw UTF-8, sorted keys); float spelling may differ, e.g. 1e+16 vs 1e16.
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def write_json(obj: Any, stream: TextIO) -> None:
+    # Emit one sorted-key JSON line as UTF-8 bytes.
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json_dumps(obj) + "\n").encode("utf-8")
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(data.decode("utf-8"))
+        return
+    stream.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def read_response_body(response: Any, url: str) -> bytes:
+    body = response.read()
+    if (response.headers.get("Content-Encoding") or "").lower() == "gzip":
+        try:
+            body = gzip.decompress(body)
+        except (OSError, EOFError, zlib.error) as exc:
+            raise ApiError(f"Invalid gzip body from {url}: {exc}") from exc
+    return body
 
 
 def http_get_any_json(url: str, headers: Optional[Dict[str, str]], timeout: int) -> Any:
-    req = urllib.request.Request(url=url, headers=headers or {}, method="GET")
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            body = response.read().decode("utf-8")
-    except urllib.error.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="replace")
-        raise ApiError(f"HTTP {exc.code} for {url}: {detail}") from exc
-    except urllib.error.URLError as exc:
-        raise ApiError(f"Network error for {url}: {exc}") from exc
+    # Forecast JSON is highly repetitive; gzip typically shrinks it 5-10x on the wire.
+    req = urllib.request.Request(url=url, headers={"Accept-Encoding": "gzip", **(headers or {})}, method="GET")
+    retries = 0
+    while True:
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                body = read_response_body(response, url)
+            break
+        except urllib.error.HTTPError as exc:
+            if exc.code in RETRY_STATUSES and retries < RETRY_TOTAL:
+                exc.close()
+                time.sleep(RETRY_BACKOFF_S * (2**retries))
+                retries += 1
+                continue
+            detail = read_response_body(exc, url).decode("utf-8", errors="replace")
+            raise ApiError(f"HTTP {exc.code} for {url}: {detail}") from exc
+        except urllib.error.URLError as exc:
+            raise ApiError(f"Network error for {url}: {exc}") from exc
 
     try:
-        parsed = json.loads(body)
+        parsed = json_loads(body)
     except json.JSONDecodeError as exc:
         raise ApiError(f"Invalid JSON from {url}: {exc}") from exc
     return parsed
@@ -122,19 +203,24 @@ def parse_sources(value: Optional[str]) -> List[str]:
     return [part.strip() for part in value.split(",") if part.strip()]
 
 
-def select_metric_value(raw: Any, source_order: List[str]) -> Optional[float]:
-    if raw is None:
-        return None
-    if isinstance(raw, (int, float)):
-        return float(raw)
+def resolve_source_order(sources: List[str]) -> List[str]:
+    if not sources:
+        return DEFAULT_SOURCE_ORDER
+    return sources + [src for src in DEFAULT_SOURCE_ORDER if src not in sources]
+
+
+def select_metric_value(raw: Any, ordered_sources: List[str]) -> Optional[float]:
+    # Per-source dicts are the common Stormglass shape, so test for them first.
     if not isinstance(raw, dict):
+        if isinstance(raw, (int, float)):
+            return float(raw)
         return None
 
-    ordered = source_order + [src for src in DEFAULT_SOURCE_ORDER if src not in source_order]
-    for key in ordered:
-        if key in raw and raw[key] is not None:
+    for key in ordered_sources:
+        val = raw.get(key)
+        if val is not None:
             try:
-                return float(raw[key])
+                return float(val)
             except (TypeError, ValueError):
                 continue
     for val in raw.values():
@@ -181,14 +267,7 @@ def geocode_location(address: str, api_key: str, timeout: int) -> Tuple[Dict[str
 
 
 def geocode_location_osm(address: str, timeout: int) -> Tuple[Dict[str, Any], List[str]]:
-    query = urllib.parse.urlencode(
-        {
-            "q": address,
-            "format": "jsonv2",
-            "limit": "5",
-            "addressdetails": "0",
-        }
-    )
+    query = f"{urllib.parse.urlencode({'q': address})}&{OSM_BASE_QUERY}"
     payload = http_get_any_json(
         f"{OSM_GEOCODE_ENDPOINT}?{query}",
         headers={"User-Agent": "stormglass-surf-skill/1.0 (+openclaw-cron)"},
@@ -226,6 +305,67 @@ def geocode_location_osm(address: str, timeout: int) -> Tuple[Dict[str, Any], Li
     return location, warnings
 
 
+def geocode_cache_key(provider: str, address: str) -> str:
+    normalized = re.sub(r"\s+", " ", address.strip().lower())
+    return f"{provider}:{normalized}"
+
+
+def geocode_cache_get(path: str, key: str) -> Optional[Tuple[Dict[str, Any], List[str]]]:
+    try:
+        with closing(sqlite3.connect(path, timeout=5)) as db:
+            row = db.execute("SELECT value, expires_at FROM geocode WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] < time.time():
+                with db:
+                    db.execute("DELETE FROM geocode WHERE key = ?", (key,))
+                return None
+        location, warnings = json_loads(row[0])
+    except (sqlite3.Error, ValueError, TypeError):
+        # Missing/corrupt cache is never fatal; fall through to a live lookup.
+        return None
+    return location, warnings
+
+
+def geocode_cache_set(path: str, key: str, value: Tuple[Dict[str, Any], List[str]], ttl_days: int) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with closing(sqlite3.connect(path, timeout=5)) as db, db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS geocode (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            db.execute(
+                "INSERT OR REPLACE INTO geocode (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json_dumps(list(value)), time.time() + ttl_days * 86400),
+            )
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def geocode_cached(
+    address: str,
+    google_key: Optional[str],
+    timeout: int,
+    cache_path: Optional[str],
+    ttl_days: int,
+) -> Tuple[Dict[str, Any], List[str]]:
+    key = geocode_cache_key("google" if google_key else "osm", address)
+    if cache_path and ttl_days > 0:
+        hit = geocode_cache_get(cache_path, key)
+        if hit is not None:
+            location, warnings = hit
+            location["query"] = address
+            return location, warnings
+
+    if google_key:
+        result = geocode_location(address, google_key, timeout)
+    else:
+        result = geocode_location_osm(address, timeout)
+    if cache_path and ttl_days > 0:
+        geocode_cache_set(cache_path, key, result, ttl_days)
+    return result
+
+
 def fetch_weather(
     lat: float,
     lon: float,
@@ -235,11 +375,10 @@ def fetch_weather(
     sources: List[str],
     timeout: int,
 ) -> List[Dict[str, Any]]:
-    params = ",".join(METRIC_MAP.keys())
     query_data = {
         "lat": lat,
         "lng": lon,
-        "params": params,
+        "params": WEATHER_PARAMS,
         "start": str(to_unix_seconds(start)),
         "end": str(to_unix_seconds(end)),
     }
@@ -293,13 +432,19 @@ def fetch_tides(
     return []
 
 
-def normalize_hour(hour: Dict[str, Any], source_order: List[str]) -> Dict[str, Any]:
+def normalize_hour(hour: Dict[str, Any], ordered_sources: List[str]) -> Dict[str, Any]:
     out: Dict[str, Any] = {"time": hour.get("time")}
     for raw_key, out_key in METRIC_MAP.items():
-        out[out_key] = select_metric_value(hour.get(raw_key), source_order)
+        out[out_key] = select_metric_value(hour.get(raw_key), ordered_sources)
+    # Parse once here; window/nearest-hour lookups compare this cached epoch value.
+    out["_ts"] = parse_time(str(hour["time"])).timestamp()
     return out
 
 
+def public_fields(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in item.items() if not k.startswith("_")}
+
+
 def hour_metrics(hour: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "waveHeightM": hour.get("waveHeightM"),
@@ -314,13 +459,11 @@ def hour_metrics(hour: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def nearest_hour(hours: List[Dict[str, Any]], anchor: datetime) -> Dict[str, Any]:
-    def distance(hour: Dict[str, Any]) -> float:
-        return abs((parse_time(str(hour["time"])) - anchor).total_seconds())
-
-    valid = [h for h in hours if "time" in h]
+    anchor_ts = anchor.timestamp()
+    valid = [h for h in hours if "_ts" in h]
     if not valid:
         raise ApiError("No weather hours with time field")
-    return min(valid, key=distance)
+    return min(valid, key=lambda h: abs(h["_ts"] - anchor_ts))
 
 
 def score_hour(hour: Dict[str, Any]) -> float:
@@ -348,18 +491,29 @@ def build_windows(
 ) -> Dict[str, Any]:
     requested = HORIZON_HOURS[horizon]
     windows: Dict[str, Any] = {}
+    if horizon == "now":
+        return windows
+
+    # Windows are nested prefixes of the requested horizon: sort once (a no-op for
+    # Stormglass's time-ordered hours), score each hour once, then bisect per window.
+    ordered = sorted(enumerate(normalized_hours), key=lambda item: item[1]["_ts"])
+    times = [h["_ts"] for _, h in ordered]
+    anchor_ts = anchor.timestamp()
+    lo = bisect.bisect_left(times, anchor_ts)
+    hi = bisect.bisect_right(times, anchor_ts + requested * 3600, lo)
+    scores = [score_hour(h) for _, h in ordered[lo:hi]]
+
     for label, hours in [("24h", 24), ("48h", 48), ("72h", 72)]:
-        if hours > requested or horizon == "now":
+        if hours > requested:
             continue
         end = anchor + timedelta(hours=hours)
-        in_window = []
-        for h in normalized_hours:
-            t = parse_time(str(h["time"]))
-            if anchor <= t <= end:
-                entry = dict(h)
-                entry["score"] = score_hour(h)
-                in_window.append(entry)
-        top = sorted(in_window, key=lambda x: x["score"], reverse=True)[:3]
+        k = bisect.bisect_right(times, end.timestamp(), lo, hi)
+        # Rank (score, hour) pairs and copy only the winners into output dicts;
+        # equal scores keep input order, as the original stable sort did.
+        ranked = heapq.nlargest(
+            3, zip(scores[: k - lo], ordered[lo:k]), key=lambda pair: (pair[0], -pair[1][0])
+        )
+        top = [{**public_fields(h), "score": score} for score, (_, h) in ranked]
         windows[label] = {
             "start": iso_z(anchor),
             "end": iso_z(end),
@@ -380,30 +534,29 @@ def normalize_tides(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             height_value = float(height) if height is not None else None
         except (TypeError, ValueError):
             height_value = None
-        out.append({"time": t, "type": item_type, "heightM": height_value})
-    out.sort(key=lambda x: x["time"])
+        entry = {"time": t, "type": item_type, "heightM": height_value}
+        # Parse once; trend lookup and day bucketing reuse these private fields.
+        try:
+            dt = parse_time(str(t))
+        except (TypeError, ValueError):
+            pass
+        else:
+            entry["_ts"] = dt.timestamp()
+            entry["_day"] = dt.date().isoformat()
+        out.append(entry)
+    # Chronological order (unparseable times last) so tide_trend_now can bisect on _ts.
+    out.sort(key=lambda x: (x.get("_ts", math.inf), x["time"]))
     return out
 
 
 def tide_trend_now(extremes: List[Dict[str, Any]], anchor: datetime) -> str:
-    parsed: List[Tuple[datetime, str]] = []
-    for e in extremes:
-        try:
-            parsed.append((parse_time(str(e["time"])), str(e.get("type", "")).lower()))
-        except Exception:
-            continue
+    parsed = [e for e in extremes if "_ts" in e]
     if not parsed:
         return "unknown"
-    prev_item = None
-    next_item = None
-    for dt, kind in parsed:
-        if dt <= anchor:
-            prev_item = (dt, kind)
-        elif dt > anchor and next_item is None:
-            next_item = (dt, kind)
-    if prev_item and next_item:
-        prev_kind = prev_item[1]
-        next_kind = next_item[1]
+    idx = bisect.bisect_right([e["_ts"] for e in parsed], anchor.timestamp())
+    if 0 < idx < len(parsed):
+        prev_kind = str(parsed[idx - 1].get("type", "")).lower()
+        next_kind = str(parsed[idx].get("type", "")).lower()
         if prev_kind == "low" and next_kind == "high":
             return "rising"
         if prev_kind == "high" and next_kind == "low":
@@ -414,9 +567,8 @@ def tide_trend_now(extremes: List[Dict[str, Any]], anchor: datetime) -> str:
 def tides_by_day(extremes: List[Dict[str, Any]]) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
     out: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
     for e in extremes:
-        try:
-            day = parse_time(str(e["time"])).date().isoformat()
-        except Exception:
+        day = e.get("_day")
+        if day is None:
             continue
         out.setdefault(day, {"high": [], "low": []})
         kind = str(e.get("type", "")).lower()
@@ -436,34 +588,45 @@ def mock_payload(
     requested_at: Optional[datetime],
 ) -> Dict[str, Any]:
     hours = HORIZON_HOURS[horizon] if horizon != "now" else 24
+    ext_count = max(6, int((HORIZON_HOURS.get(horizon, 72) / 6) + 2))
+
+    # Hourly and tide stamps share one hourly grid; build and format it once.
+    span = max(hours, (ext_count - 1) * 6)
+    grid = [anchor + timedelta(hours=i) for i in range(span + 1)]
+    grid_iso = [iso_z(t) for t in grid]
+
+    sin = math.sin
+    cos = math.cos
     normalized_hours: List[Dict[str, Any]] = []
     for i in range(hours + 1):
-        t = anchor + timedelta(hours=i)
+        wind_phase = sin(i / 5.0)  # shared by wind speed and gust
         normalized_hours.append(
             {
-                "time": iso_z(t),
-                "waveHeightM": round(0.9 + 0.5 * math.sin(i / 6.0), 2),
-                "swellHeightM": round(0.7 + 0.3 * math.cos(i / 7.0), 2),
-                "swellPeriodS": round(8.0 + 2.0 * math.sin(i / 8.0), 2),
-                "swellDirectionDeg": round(240 + 15 * math.cos(i / 12.0), 1),
-                "windSpeedMps": round(4.0 + 2.0 * math.sin(i / 5.0), 2),
-                "windDirectionDeg": round(210 + 25 * math.cos(i / 9.0), 1),
-                "windGustMps": round(6.0 + 2.5 * math.sin(i / 5.0), 2),
-                "waterTemperatureC": round(10.5 + 0.8 * math.sin(i / 24.0), 2),
+                "time": grid_iso[i],
+                "_ts": grid[i].timestamp(),
+                "waveHeightM": round(0.9 + 0.5 * sin(i / 6.0), 2),
+                "swellHeightM": round(0.7 + 0.3 * cos(i / 7.0), 2),
+                "swellPeriodS": round(8.0 + 2.0 * sin(i / 8.0), 2),
+                "swellDirectionDeg": round(240 + 15 * cos(i / 12.0), 1),
+                "windSpeedMps": round(4.0 + 2.0 * wind_phase, 2),
+                "windDirectionDeg": round(210 + 25 * cos(i / 9.0), 1),
+                "windGustMps": round(6.0 + 2.5 * wind_phase, 2),
+                "waterTemperatureC": round(10.5 + 0.8 * sin(i / 24.0), 2),
             }
         )
 
     extremes: List[Dict[str, Any]] = []
-    ext_count = max(6, int((HORIZON_HOURS.get(horizon, 72) / 6) + 2))
     kind = "low"
     for i in range(ext_count):
-        t = anchor + timedelta(hours=i * 6)
+        t = grid[i * 6]
         kind = "high" if kind == "low" else "low"
         extremes.append(
             {
-                "time": iso_z(t),
+                "time": grid_iso[i * 6],
                 "type": kind,
                 "heightM": round(1.0 + (0.8 if kind == "high" else -0.3), 2),
+                "_ts": t.timestamp(),
+                "_day": t.date().isoformat(),
             }
         )
 
@@ -492,11 +655,11 @@ def mock_payload(
             "lon": lon,
             "googlePlaceId": None,
         },
-        "now": nearest,
+        "now": public_fields(nearest),
         "forecast": {"windows": build_windows(normalized_hours, anchor, horizon)},
         "tides": {
             "trendNow": tide_trend_now(extremes, anchor),
-            "extremes": extremes,
+            "extremes": [public_fields(e) for e in extremes],
             "byDay": tides_by_day(extremes),
         },
     }
@@ -533,10 +696,13 @@ def build_report(args: argparse.Namespace) -> Dict[str, Any]:
 
     if args.location:
         geocode_key = os.environ.get("GOOGLE_GEOCODING_API_KEY")
-        if geocode_key:
-            location, geo_warnings = geocode_location(args.location, geocode_key, args.timeout)
-        else:
-            location, geo_warnings = geocode_location_osm(args.location, args.timeout)
+        location, geo_warnings = geocode_cached(
+            args.location,
+            geocode_key,
+            args.timeout,
+            None if args.no_geocode_cache else GEOCODE_CACHE_PATH,
+            args.geocode_cache_ttl_days,
+        )
         warnings.extend(geo_warnings)
         lat = location["lat"]
         lon = location["lon"]
@@ -557,11 +723,17 @@ def build_report(args: argparse.Namespace) -> Dict[str, Any]:
         start = min(start, requested_at - timedelta(hours=1))
         end = max(end, requested_at + timedelta(hours=1))
 
-    weather_hours = fetch_weather(lat, lon, stormglass_key, start, end, sources, args.timeout)
-    tide_data = fetch_tides(lat, lon, stormglass_key, anchor, end + timedelta(days=1), args.timeout)
+    # Weather and tide lookups are independent; overlap their round trips.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        weather_future = pool.submit(fetch_weather, lat, lon, stormglass_key, start, end, sources, args.timeout)
+        tide_future = pool.submit(
+            fetch_tides, lat, lon, stormglass_key, anchor, end + timedelta(days=1), args.timeout
+        )
+        weather_hours = weather_future.result()
+        tide_data = tide_future.result()
 
-    source_order = sources[:] if sources else []
-    normalized = [normalize_hour(hour, source_order) for hour in weather_hours if "time" in hour]
+    ordered_sources = resolve_source_order(sources)
+    normalized = [normalize_hour(hour, ordered_sources) for hour in weather_hours if "time" in hour]
     if not normalized:
         raise ApiError("No weather data points returned")
 
@@ -577,11 +749,11 @@ def build_report(args: argparse.Namespace) -> Dict[str, Any]:
             "warnings": warnings,
         },
         "location": location,
-        "now": current,
+        "now": public_fields(current),
         "forecast": {"windows": build_windows(normalized, anchor, args.horizon)},
         "tides": {
             "trendNow": tide_trend_now(extremes, anchor),
-            "extremes": extremes,
+            "extremes": [public_fields(e) for e in extremes],
             "byDay": tides_by_day(extremes),
         },
     }
@@ -627,26 +799,46 @@ def to_pretty(report: Dict[str, Any]) -> str:
 
 def parse_args(argv: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Fetch surf-relevant Stormglass data by location or coordinates.")
-    parser.add_argument("--location", help="Surf spot/place name for geocoding lookup.")
-    parser.add_argument("--lat", type=float, help="Latitude for direct coordinate mode.")
-    parser.add_argument("--lon", type=float, help="Longitude for direct coordinate mode.")
+    # At most one location mode; argparse enforces exclusivity. --lon pairs with --lat and
+    # the "no mode given" case is reported below so a lone --lon gets the pairing error.
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--location", help="Surf spot/place name for geocoding lookup.")
+    mode.add_argument(
+        "--coords",
+        nargs=2,
+        type=float,
+        metavar=("LAT", "LON"),
+        help="Latitude and longitude for direct coordinate mode.",
+    )
+    mode.add_argument("--lat", type=float, help="Latitude for direct coordinate mode (use with --lon).")
+    parser.add_argument("--lon", type=float, help="Longitude for direct coordinate mode (use with --lat).")
     parser.add_argument("--horizon", choices=["now", "24h", "48h", "72h"], default="72h")
     parser.add_argument("--at", help="Optional ISO-8601 timestamp; include nearest-hour snapshot for that time.")
     parser.add_argument("--output", choices=["json", "pretty"], default="json")
     parser.add_argument("--source", help="Optional comma-separated Stormglass sources.")
     parser.add_argument("--timeout", type=int, default=20, help="HTTP timeout seconds.")
     parser.add_argument("--mock", action="store_true", help="Use deterministic offline mock data.")
+    parser.add_argument("--no-geocode-cache", action="store_true", help="Bypass the on-disk geocoding cache.")
+    parser.add_argument(
+        "--geocode-cache-ttl-days",
+        type=int,
+        default=GEOCODE_CACHE_TTL_DAYS,
+        help="Days to keep cached geocoding results (0 disables caching).",
+    )
 
     args = parser.parse_args(argv)
 
-    has_location = bool(args.location)
-    has_coords = args.lat is not None or args.lon is not None
-    if has_location and has_coords:
-        parser.error("Use either --location or --lat/--lon, not both.")
-    if not has_location and not has_coords:
-        parser.error("Provide --location or both --lat and --lon.")
-    if has_coords and (args.lat is None or args.lon is None):
+    if args.location == "":
+        parser.error("--location must not be empty.")
+    if args.lon is not None and args.lat is None and (args.location is not None or args.coords):
+        other = "--location" if args.location is not None else "--coords"
+        parser.error(f"Use either {other} or --lat/--lon, not both.")
+    if (args.lat is None) != (args.lon is None):
         parser.error("Both --lat and --lon are required for coordinate mode.")
+    if args.location is None and args.coords is None and args.lat is None:
+        parser.error("Provide --location, --coords, or both --lat and --lon.")
+    if args.coords:
+        args.lat, args.lon = args.coords
     return args
 
 
@@ -655,7 +847,7 @@ def main(argv: List[str]) -> int:
         args = parse_args(argv)
         report = build_report(args)
         if args.output == "json":
-            print(json.dumps(report, ensure_ascii=True, sort_keys=True))
+            write_json(report, sys.stdout)
         else:
             print(to_pretty(report))
         return 0
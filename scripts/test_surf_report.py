@@ -7,27 +7,51 @@ This script executes the CLI with multiple argument combinations and verifies:
 - JSON output shape and key fields
 - Handling of location mode and coordinate mode
 - Argument validation failures
+- scripts/normalize_surf_data.py defaults and input errors
 
-Uses --mock to avoid external API calls and credentials.
+It also runs in-process checks of the HTTP helper against a local http.server
+(redirects, retries, gzip, proxies), of the on-disk geocoding cache, and of the
+report helpers that --mock bypasses (source selection, tide trend, windows).
+
+Uses --mock and a loopback server to avoid external API calls and credentials.
 """
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
+import sqlite3
 import subprocess
 import sys
+import tempfile
+import threading
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 
 ROOT = Path(__file__).resolve().parent.parent
 CLI = ROOT / "scripts" / "surf_report.py"
-PYTHON_BIN = "/usr/bin/python3"
+NORMALIZER = ROOT / "scripts" / "normalize_surf_data.py"
+PYTHON_BIN = sys.executable
+
+sys.path.insert(0, str(CLI.parent))
+import normalize_surf_data  # noqa: E402
+import surf_report  # noqa: E402
 
+PROXY_ENV_KEYS = ("http_proxy", "https_proxy", "no_proxy", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY")
 
-def run_case(args: List[str]) -> subprocess.CompletedProcess[str]:
-    cmd = [PYTHON_BIN, str(CLI)] + args
-    return subprocess.run(cmd, capture_output=True, text=True, check=False, cwd=str(ROOT))
+
+def run_case(args: List[str], script: Path = CLI, stdin: Optional[str] = None) -> subprocess.CompletedProcess[str]:
+    cmd = [PYTHON_BIN, str(script)] + args
+    return subprocess.run(
+        cmd, input=stdin, capture_output=True, text=True, encoding="utf-8", check=False, cwd=str(ROOT)
+    )
 
 
 def assert_json_shape(stdout: str) -> None:
@@ -73,6 +97,381 @@ def assert_at_shape(stdout: str) -> None:
             raise AssertionError(f"Missing at.metrics.{key}")
 
 
+class FakeApiHandler(BaseHTTPRequestHandler):
+    """Loopback stand-in for the external APIs; also answers proxy-style absolute-URI requests."""
+
+    protocol_version = "HTTP/1.1"
+    server: "FakeApiServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def send_body(self, code: int, body: bytes, extra: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(code)
+        for key, value in (extra or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self.server.requests.append((self.path, dict(self.headers)))
+        path = urllib.parse.urlsplit(self.path).path
+        self.server.hits[path] = self.server.hits.get(path, 0) + 1
+        ok = b'{"ok":true}'
+        if path == "/redirect":
+            self.send_body(302, b"", {"Location": "/ok"})
+        elif path == "/flaky":
+            self.send_body(429 if self.server.hits[path] <= 2 else 200, ok)
+        elif path == "/always-503":
+            self.send_body(503, b"busy")
+        elif path == "/gzip":
+            if "gzip" not in (self.headers.get("Accept-Encoding") or ""):
+                self.send_body(406, b"gzip required")
+            else:
+                self.send_body(200, gzip.compress(ok), {"Content-Encoding": "gzip"})
+        elif path == "/missing":
+            self.send_body(404, b"not here")
+        else:
+            self.send_body(200, ok)
+
+
+class FakeApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), FakeApiHandler)
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        self.hits: Dict[str, int] = {}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+@contextmanager
+def fake_api() -> Iterator[FakeApiServer]:
+    server = FakeApiServer()
+    # A short poll interval keeps shutdown() from blocking ~0.5s per check.
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def proxy_env(**values: str) -> Iterator[None]:
+    # urlopen caches an opener that snapshots proxy settings; reset it on entry and exit.
+    saved = {key: os.environ.get(key) for key in PROXY_ENV_KEYS}
+    for key in PROXY_ENV_KEYS:
+        os.environ.pop(key, None)
+    os.environ.update(values)
+    urllib.request.install_opener(None)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        urllib.request.install_opener(None)
+
+
+def expect_api_error(url: str, fragment: str) -> None:
+    try:
+        surf_report.http_get_any_json(url, None, 5)
+    except surf_report.ApiError as exc:
+        if fragment not in str(exc):
+            raise AssertionError(f"ApiError {exc!s} missing {fragment!r}")
+        return
+    raise AssertionError(f"Expected ApiError for {url}")
+
+
+def check_http_redirect() -> None:
+    with fake_api() as server, proxy_env(no_proxy="127.0.0.1"):
+        if surf_report.http_get_any_json(f"{server.base_url}/redirect", None, 5) != {"ok": True}:
+            raise AssertionError("redirect not followed")
+        if server.hits.get("/ok") != 1:
+            raise AssertionError(f"expected one request to /ok, got {server.hits}")
+
+
+def check_http_retry() -> None:
+    backoff = surf_report.RETRY_BACKOFF_S
+    surf_report.RETRY_BACKOFF_S = 0.0
+    try:
+        with fake_api() as server, proxy_env(no_proxy="127.0.0.1"):
+            if surf_report.http_get_any_json(f"{server.base_url}/flaky", None, 5) != {"ok": True}:
+                raise AssertionError("429 responses were not retried")
+            if server.hits["/flaky"] != 3:
+                raise AssertionError(f"expected 3 attempts, got {server.hits['/flaky']}")
+            expect_api_error(f"{server.base_url}/always-503", "HTTP 503")
+            if server.hits["/always-503"] != surf_report.RETRY_TOTAL + 1:
+                raise AssertionError(f"expected {surf_report.RETRY_TOTAL + 1} attempts, got {server.hits}")
+            expect_api_error(f"{server.base_url}/missing", "HTTP 404")
+            if server.hits["/missing"] != 1:
+                raise AssertionError("404 must not be retried")
+    finally:
+        surf_report.RETRY_BACKOFF_S = backoff
+
+
+def check_http_gzip() -> None:
+    with fake_api() as server, proxy_env(no_proxy="127.0.0.1"):
+        if surf_report.http_get_any_json(f"{server.base_url}/gzip", None, 5) != {"ok": True}:
+            raise AssertionError("gzip body not decoded")
+
+
+def check_http_proxy() -> None:
+    with fake_api() as server:
+        with proxy_env(http_proxy=server.base_url):
+            url = "http://stormglass-proxy-test.invalid/ok?x=1"
+            if surf_report.http_get_any_json(url, None, 5) != {"ok": True}:
+                raise AssertionError("request via proxy failed")
+            path, headers = server.requests[-1]
+            if path != url:
+                raise AssertionError(f"proxy saw {path!r}, expected absolute URI")
+            if "User-Agent" not in headers:
+                raise AssertionError("default User-Agent header missing")
+        # NO_PROXY must bypass an (unreachable) proxy.
+        with proxy_env(http_proxy="http://127.0.0.1:9", no_proxy="127.0.0.1"):
+            if surf_report.http_get_any_json(f"{server.base_url}/ok", None, 5) != {"ok": True}:
+                raise AssertionError("no_proxy not honored")
+
+
+def check_geocode_cache() -> None:
+    calls: List[Tuple[str, str]] = []
+
+    def fake_osm(address: str, timeout: int) -> Tuple[Dict[str, Any], List[str]]:
+        calls.append(("osm", address))
+        location = {"query": address, "resolvedName": "OSM", "lat": 1.0, "lon": 2.0, "googlePlaceId": None}
+        return location, ["osm fallback"]
+
+    def fake_google(address: str, api_key: str, timeout: int) -> Tuple[Dict[str, Any], List[str]]:
+        calls.append(("google", address))
+        location = {"query": address, "resolvedName": "Google", "lat": 1.0, "lon": 2.0, "googlePlaceId": "p"}
+        return location, []
+
+    def lookup(address: str, google_key: Optional[str], path: Optional[str], ttl_days: int = 30) -> Any:
+        return surf_report.geocode_cached(address, google_key, 5, path, ttl_days)
+
+    def expect_calls(count: int, step: str) -> None:
+        if len(calls) != count:
+            raise AssertionError(f"{step}: expected {count} live lookups, got {calls}")
+
+    if surf_report.geocode_cache_key("osm", "  Highcliffe \t  BEACH ") != "osm:highcliffe beach":
+        raise AssertionError("cache key not normalized")
+
+    saved = (surf_report.geocode_location_osm, surf_report.geocode_location)
+    surf_report.geocode_location_osm = fake_osm
+    surf_report.geocode_location = fake_google
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "nested", "geocode.sqlite3")
+
+            lookup("  Highcliffe   Beach ", None, path)
+            expect_calls(1, "first lookup")
+            location, warnings = lookup("highcliffe beach", None, path)
+            expect_calls(1, "normalized repeat")
+            if location["query"] != "highcliffe beach" or warnings != ["osm fallback"]:
+                raise AssertionError(f"unexpected cache hit payload: {location}, {warnings}")
+
+            location, _ = lookup("Highcliffe Beach", "google-key", path)
+            expect_calls(2, "google provider")
+            if location["resolvedName"] != "Google":
+                raise AssertionError("providers share cache entries")
+            lookup("Highcliffe Beach", "google-key", path)
+            expect_calls(2, "google repeat")
+
+            with sqlite3.connect(path) as db:
+                db.execute("UPDATE geocode SET expires_at = 0 WHERE key = 'osm:highcliffe beach'")
+            if surf_report.geocode_cache_get(path, "osm:highcliffe beach") is not None:
+                raise AssertionError("expired entry returned")
+            with sqlite3.connect(path) as db:
+                rows = db.execute("SELECT key FROM geocode ORDER BY key").fetchall()
+            if rows != [("google:highcliffe beach",)]:
+                raise AssertionError(f"expired entry not deleted: {rows}")
+            lookup("Highcliffe Beach", None, path)
+            expect_calls(3, "after expiry")
+
+            lookup("Other Spot", None, path, ttl_days=0)
+            lookup("Other Spot", None, path, ttl_days=0)
+            expect_calls(5, "ttl_days=0")
+            with sqlite3.connect(path) as db:
+                written = db.execute("SELECT COUNT(*) FROM geocode WHERE key = 'osm:other spot'").fetchone()[0]
+            if written:
+                raise AssertionError("ttl_days=0 still wrote to the cache")
+
+            lookup("Other Spot", None, None)
+            expect_calls(6, "cache disabled")
+
+            blocker = os.path.join(tmp, "blocker")
+            with open(blocker, "w", encoding="utf-8"):
+                pass
+            unwritable = os.path.join(blocker, "geocode.sqlite3")
+            location, _ = lookup("Other Spot", None, unwritable)
+            lookup("Other Spot", None, unwritable)
+            expect_calls(8, "unwritable cache path")
+            if location["resolvedName"] != "OSM":
+                raise AssertionError("unwritable cache broke the live lookup")
+    finally:
+        surf_report.geocode_location_osm, surf_report.geocode_location = saved
+
+
+def make_hour(time: str, **metrics: float) -> Dict[str, Any]:
+    raw: Dict[str, Any] = {"time": time}
+    raw.update({key: {"sg": value} for key, value in metrics.items()})
+    return surf_report.normalize_hour(raw, surf_report.DEFAULT_SOURCE_ORDER)
+
+
+def check_nearest_hour() -> None:
+    hours = [
+        make_hour("2026-01-01T03:00:00+00:00", waveHeight=3.0),
+        make_hour("2026-01-01T01:00:00+00:00", waveHeight=1.0),
+        make_hour("2026-01-01T02:00:00+00:00", waveHeight=2.0),
+    ]
+    anchor = surf_report.parse_time("2026-01-01T02:20:00Z")
+    if surf_report.nearest_hour(hours, anchor)["waveHeightM"] != 2.0:
+        raise AssertionError("nearest hour not picked from unsorted hours")
+    # Equidistant hours: the first one in input order wins, as with min().
+    tie = surf_report.parse_time("2026-01-01T02:30:00Z")
+    if surf_report.nearest_hour(hours, tie)["waveHeightM"] != 3.0:
+        raise AssertionError("tie not broken by input order")
+    if surf_report.nearest_hour([{"time": "bogus"}] + hours[1:], anchor)["waveHeightM"] != 2.0:
+        raise AssertionError("hour without _ts not skipped")
+    try:
+        surf_report.nearest_hour([{"time": "2026-01-01T02:00:00Z"}], anchor)
+    except surf_report.ApiError:
+        pass
+    else:
+        raise AssertionError("expected ApiError when no hour has _ts")
+
+
+def check_select_metric_value() -> None:
+    select = surf_report.select_metric_value
+    noaa_first = surf_report.resolve_source_order(["noaa", "sg"])
+    if noaa_first != ["noaa", "sg", "icon", "gfs", "ecmwf", "dwd"]:
+        raise AssertionError(f"unexpected source order {noaa_first}")
+    if surf_report.resolve_source_order([]) != surf_report.DEFAULT_SOURCE_ORDER:
+        raise AssertionError("empty --source must use the default order")
+    cases: List[Tuple[Any, List[str], Optional[float]]] = [
+        ({"sg": 1.0, "noaa": 2.0}, noaa_first, 2.0),
+        ({"sg": 1.0, "noaa": 2.0}, surf_report.DEFAULT_SOURCE_ORDER, 1.0),
+        ({"noaa": None, "sg": "bad", "icon": "3.5"}, noaa_first, 3.5),
+        ({"noaa": True}, noaa_first, 1.0),
+        ({"custom": "4.5", "other": None}, noaa_first, 4.5),
+        ({"sg": "bad", "custom": "worse"}, noaa_first, None),
+        ({}, noaa_first, None),
+        (None, noaa_first, None),
+        ("bad", noaa_first, None),
+        (True, noaa_first, 1.0),
+        (7, noaa_first, 7.0),
+    ]
+    for raw, order, expected in cases:
+        got = select(raw, order)
+        if got != expected or type(got) is not type(expected):
+            raise AssertionError(f"select_metric_value({raw!r}) = {got!r}, expected {expected!r}")
+
+
+def check_tide_trend() -> None:
+    extremes = surf_report.normalize_tides(
+        [
+            {"time": "2026-01-01T12:00:00+00:00", "type": "high", "height": "1.5"},
+            {"time": "not-a-time", "type": "low", "height": 0.2},
+            {"time": "2026-01-01T06:00:00+00:00", "type": "low", "height": 0.3},
+            {"time": "2026-01-01T18:00:00+00:00", "type": "low", "height": "bad"},
+            {"type": "high", "height": 1.0},
+        ]
+    )
+    times = [e["time"] for e in extremes]
+    expected_times = ["2026-01-01T06:00:00+00:00", "2026-01-01T12:00:00+00:00", "2026-01-01T18:00:00+00:00", "not-a-time"]
+    if times != expected_times:
+        raise AssertionError(f"tides not sorted with unparseable times last: {times}")
+    if "_ts" in extremes[-1] or [e["heightM"] for e in extremes] != [0.3, 1.5, None, 0.2]:
+        raise AssertionError(f"unexpected normalized tides: {extremes}")
+    for anchor, expected in [
+        ("2026-01-01T05:00:00Z", "unknown"),
+        ("2026-01-01T06:00:00Z", "rising"),
+        ("2026-01-01T09:00:00Z", "rising"),
+        ("2026-01-01T15:00:00Z", "falling"),
+        ("2026-01-01T19:00:00Z", "unknown"),
+    ]:
+        got = surf_report.tide_trend_now(extremes, surf_report.parse_time(anchor))
+        if got != expected:
+            raise AssertionError(f"tide trend at {anchor}: {got}, expected {expected}")
+    if surf_report.tide_trend_now(extremes[-1:], surf_report.parse_time("2026-01-01T09:00:00Z")) != "unknown":
+        raise AssertionError("unparseable-only tides must give an unknown trend")
+    if sorted(surf_report.tides_by_day(extremes)) != ["2026-01-01"]:
+        raise AssertionError("unparseable tide time was bucketed by day")
+
+
+def check_build_windows() -> None:
+    anchor = surf_report.parse_time("2026-01-01T00:00:00Z")
+    # Unsorted input; the three 0.5m hours tie on score.
+    hours = [
+        make_hour("2025-12-31T23:00:00+00:00", waveHeight=1.2),
+        make_hour("2026-01-01T03:00:00+00:00", waveHeight=0.5),
+        make_hour("2026-01-02T06:00:00+00:00", waveHeight=1.2),
+        make_hour("2026-01-01T01:00:00+00:00", waveHeight=0.5),
+        make_hour("2026-01-04T08:00:00+00:00", waveHeight=1.2),
+        make_hour("2026-01-01T02:00:00+00:00", waveHeight=0.5),
+        make_hour("2026-01-02T00:00:00+00:00", waveHeight=1.0),
+    ]
+    windows = surf_report.build_windows(hours, anchor, "72h")
+    expected = {
+        # Ties keep input order (03:00 before 01:00), as a stable sort on score did.
+        "24h": ["2026-01-02T00:00:00+00:00", "2026-01-01T03:00:00+00:00", "2026-01-01T01:00:00+00:00"],
+        "48h": ["2026-01-02T06:00:00+00:00", "2026-01-02T00:00:00+00:00", "2026-01-01T03:00:00+00:00"],
+        "72h": ["2026-01-02T06:00:00+00:00", "2026-01-02T00:00:00+00:00", "2026-01-01T03:00:00+00:00"],
+    }
+    for label, times in expected.items():
+        best = windows[label]["bestHours"]
+        if [h["time"] for h in best] != times:
+            raise AssertionError(f"{label} bestHours {[h['time'] for h in best]}, expected {times}")
+        for h in best:
+            if "_ts" in h or h["score"] != surf_report.score_hour(h):
+                raise AssertionError(f"{label} entry not scored/public: {h}")
+    if list(surf_report.build_windows(hours, anchor, "24h")) != ["24h"]:
+        raise AssertionError("24h horizon should only build the 24h window")
+    if surf_report.build_windows(hours, anchor, "now") != {}:
+        raise AssertionError("now horizon should build no windows")
+
+
+IN_PROCESS_CHECKS: List[Tuple[str, Callable[[], None]]] = [
+    ("http follows redirects", check_http_redirect),
+    ("http retries 429/5xx only", check_http_retry),
+    ("http decodes gzip responses", check_http_gzip),
+    ("http honors proxy env", check_http_proxy),
+    ("geocode cache hit/miss/expiry", check_geocode_cache),
+    ("nearest_hour on unsorted hours", check_nearest_hour),
+    ("select_metric_value source precedence", check_select_metric_value),
+    ("tide extremes and current trend", check_tide_trend),
+    ("build_windows on unsorted tied hours", check_build_windows),
+]
+
+
+def assert_normalized(stdout: str) -> None:
+    payload = json.loads(stdout)
+    now = payload["now"]
+    missing = [key for key in normalize_surf_data.NOW_KEYS if key not in now]
+    if missing:
+        raise AssertionError(f"Missing now keys: {missing}")
+    if now["waveHeightM"] != 1 or now["windSpeedMps"] is not None:
+        raise AssertionError(f"Existing now values must win over null defaults: {now}")
+    if payload["x"] != "\u00e9" or "\u00e9" not in stdout:
+        raise AssertionError("Non-ASCII value not passed through as raw UTF-8")
+    if payload["tides"] != {"extremes": [], "byDay": {}, "trendNow": "unknown"}:
+        raise AssertionError(f"Unexpected tide defaults: {payload['tides']}")
+
+
+def assert_coordinates(stdout: str, lat: float, lon: float) -> None:
+    location = json.loads(stdout)["location"]
+    if (location.get("lat"), location.get("lon")) != (lat, lon):
+        raise AssertionError(f"Expected location {lat},{lon}, got {location.get('lat')},{location.get('lon')}")
+
+
 def main() -> int:
     failures = []
 
@@ -89,6 +488,13 @@ def main() -> int:
             "expect_code": 0,
             "expect_json": True,
         },
+        {
+            "name": "coords pair 48h json mock",
+            "args": ["--coords", "50.735", "-1.705", "--horizon", "48h", "--mock", "--output", "json"],
+            "expect_code": 0,
+            "expect_json": True,
+            "expect_coords": (50.735, -1.705),
+        },
         {
             "name": "coords 72h pretty mock",
             "args": ["--lat", "50.735", "--lon", "-1.705", "--horizon", "72h", "--mock", "--output", "pretty"],
@@ -112,17 +518,34 @@ def main() -> int:
             "expect_json": True,
             "expect_at": True,
         },
+        {
+            "name": "geocode cache flags accepted in mock mode",
+            "args": [
+                "--location",
+                "Highcliffe Beach",
+                "--horizon",
+                "24h",
+                "--no-geocode-cache",
+                "--geocode-cache-ttl-days",
+                "7",
+                "--mock",
+            ],
+            "expect_code": 0,
+            "expect_json": True,
+        },
         {
             "name": "missing location and coords",
             "args": ["--horizon", "24h", "--mock"],
             "expect_code": 2,
             "expect_json": False,
+            "expect_stderr": "Provide --location, --coords, or both --lat and --lon.",
         },
         {
             "name": "partial coords missing lon",
             "args": ["--lat", "50.735", "--mock"],
             "expect_code": 2,
             "expect_json": False,
+            "expect_stderr": "Both --lat and --lon are required for coordinate mode.",
         },
         {
             "name": "location and coords together invalid",
@@ -130,32 +553,106 @@ def main() -> int:
             "expect_code": 2,
             "expect_json": False,
         },
+        {
+            "name": "location and coords pair together invalid",
+            "args": ["--location", "Highcliffe Beach", "--coords", "50.735", "-1.705", "--mock"],
+            "expect_code": 2,
+            "expect_json": False,
+        },
+        {
+            "name": "location and lone --lon conflict",
+            "args": ["--location", "Highcliffe Beach", "--lon", "-1.705", "--mock"],
+            "expect_code": 2,
+            "expect_json": False,
+            "expect_stderr": "Use either --location or --lat/--lon, not both.",
+        },
+        {
+            "name": "coords pair and lone --lon conflict",
+            "args": ["--coords", "50.735", "-1.705", "--lon", "-1.705", "--mock"],
+            "expect_code": 2,
+            "expect_json": False,
+            "expect_stderr": "Use either --coords or --lat/--lon, not both.",
+        },
+        {
+            "name": "partial coords missing lat",
+            "args": ["--lon", "-1.705", "--mock"],
+            "expect_code": 2,
+            "expect_json": False,
+            "expect_stderr": "Both --lat and --lon are required for coordinate mode.",
+        },
+        {
+            "name": "normalizer fills now defaults on partial payload",
+            "script": NORMALIZER,
+            "args": [],
+            "stdin": '{"now":{"waveHeightM":1},"x":"\u00e9"}',
+            "expect_code": 0,
+            "expect_json": False,
+            "expect_normalized": True,
+        },
+        {
+            "name": "normalizer rejects invalid JSON",
+            "script": NORMALIZER,
+            "args": [],
+            "stdin": '{"now":',
+            "expect_code": 2,
+            "expect_json": False,
+            "expect_stderr": "Invalid JSON",
+        },
+        {
+            "name": "normalizer rejects non-object JSON",
+            "script": NORMALIZER,
+            "args": [],
+            "stdin": "[1]",
+            "expect_code": 2,
+            "expect_json": False,
+            "expect_stderr": "Expected top-level JSON object",
+        },
     ]
 
-    for case in cases:
-        proc = run_case(case["args"])
+    # Cases are independent --mock subprocesses; run them concurrently to overlap interpreter startup.
+    with ThreadPoolExecutor(max_workers=min(8, len(cases))) as pool:
+        procs = list(pool.map(lambda case: run_case(case["args"], case.get("script", CLI), case.get("stdin")), cases))
+
+    for case, proc in zip(cases, procs):
         ok = proc.returncode == case["expect_code"]
         if ok and case["expect_json"]:
             try:
                 assert_json_shape(proc.stdout)
                 if case.get("expect_at"):
                     assert_at_shape(proc.stdout)
+                if case.get("expect_coords"):
+                    assert_coordinates(proc.stdout, *case["expect_coords"])
             except Exception as exc:
                 ok = False
                 failures.append(f"{case['name']}: json validation failed ({exc})")
+        if ok and case.get("expect_normalized"):
+            try:
+                assert_normalized(proc.stdout)
+            except Exception as exc:
+                ok = False
+                failures.append(f"{case['name']}: normalized output check failed ({exc})")
+        if ok and case.get("expect_stderr") and case["expect_stderr"] not in proc.stderr:
+            ok = False
+            failures.append(f"{case['name']}: stderr missing {case['expect_stderr']!r}")
         if not ok:
             failures.append(
                 f"{case['name']}: expected code {case['expect_code']}, got {proc.returncode}. "
                 f"stderr={proc.stderr.strip()!r}"
             )
 
+    for name, check in IN_PROCESS_CHECKS:
+        try:
+            check()
+        except Exception as exc:
+            failures.append(f"{name}: {exc}")
+
     if failures:
         print("TEST FAILURES:", file=sys.stderr)
         for item in failures:
             print(f"- {item}", file=sys.stderr)
         return 1
 
-    print(f"All {len(cases)} test cases passed.")
+    print(f"All {len(cases) + len(IN_PROCESS_CHECKS)} test cases passed.")
     return 0
 
 